@@ -27,6 +27,12 @@ class Config:
     price_decimal_places: int = 2
     greek_decimal_places: int = 2
     
+    # Pricing: Abramowitz & Stegun normal CDF approximation in the batch and
+    # scalar kernels (faster; CDF abs error < 7.5e-8, PV error scales with
+    # spot/strike x notional) vs exact erfc, or scipy ndtr in the NumPy batch
+    # fallback when numba is missing
+    approximate_normal_cdf: bool = False
+    
     # Validation thresholds
     max_volatility: float = 1.0  # 100%
     min_time_to_expiry_years: float = 0.01
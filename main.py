@@ -24,7 +24,9 @@ class FXOptionsRiskAggregator:
         self.config = config
         self.data_loader = DataLoaderService()
         self.validator = ValidationService()
-        self.pricing_engine = PricingEngineService()
+        self.pricing_engine = PricingEngineService(
+            approximate_cdf=config.approximate_normal_cdf
+        )
         self.aggregator = AggregationService()
         self.output_writer = OutputWriterService()
     
@@ -2,10 +2,14 @@
 Domain models for FX Options trading system.
 Defines data structures at different stages of the pipeline.
 """
+from dataclasses import dataclass
 from datetime import date
 from enum import Enum
-from typing import List
-from pydantic import BaseModel, Field, model_validator
+from typing import TYPE_CHECKING, Iterator, List, Sequence
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class OptionType(str, Enum):
@@ -24,10 +28,12 @@ class CurrencyPair(str, Enum):
     USDCHF = "USDCHF"
 
 
-class RawTrade(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RawTrade:
     """
     Raw trade data as loaded from Excel.
-    Minimal validation - accepts various formats.
+    No validation - the data loader has already stripped strings
+    and coerced numeric columns to float.
     """
     TradeID: str
     Underlying: str  #"EUR/USD"
@@ -40,45 +46,65 @@ class RawTrade(BaseModel):
     RateForeign: float
     Expiry: float  # Time to expiry in years
     OptionType: str  # "Call" or "Put"
-    
-    class Config:
-        str_strip_whitespace = True
 
 
-class ValidatedTrade(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidatedTrade:
     """
-    Validated trade with proper types and business logic validation.
+    Validated trade with proper types, ready for pricing.
+    
+    Plain frozen dataclass: range and business-rule checks are applied by
+    ValidationService before construction, so building one does no
+    per-field validation.
     """
-    trade_id: str = Field(..., description="Unique trade identifier")
+    trade_id: str
     currency_pair: CurrencyPair
     option_type: OptionType
-    strike: float = Field(gt=0, description="Strike price (must be positive)")
-    notional: float = Field(gt=0, description="Notional amount (must be positive)")
-    notional_currency: str = Field(..., description="Currency of notional (USD or JPY)")
-    time_to_expiry: float = Field(gt=0, le=10.0, description="Time to expiry in years")
-    spot: float = Field(gt=0, description="Current spot rate")
-    volatility: float = Field(gt=0, le=5.0, description="Implied volatility (0-500%)")
-    domestic_rate: float = Field(ge=-0.1, le=1.0, description="Domestic risk-free rate")
-    foreign_rate: float = Field(ge=-0.1, le=1.0, description="Foreign risk-free rate")
-    
-    @model_validator(mode='after')
-    def validate_business_rules(self) -> 'ValidatedTrade':
-        """Apply cross-field business logic validation."""
-        # Reasonable parameter ranges
-        if self.volatility > 1.0:  # 100% vol
-            raise ValueError(f"Volatility {self.volatility:.2%} seems unreasonably high")
-        
-        # Ensure notional currency matches currency pair
-        if self.notional_currency not in ['USD', 'JPY']:
-            raise ValueError(f"NotionalCurrency must be USD or JPY, got {self.notional_currency}")
-        
-        return self
+    strike: float
+    notional: float
+    notional_currency: str  # "USD" or "JPY"
+    time_to_expiry: float  # Time to expiry in years
+    spot: float
+    volatility: float
+    domestic_rate: float
+    foreign_rate: float
+
+
+# Record layout of one priced trade, for structured NumPy arrays. String
+# fields are stored as uint8 codes: the position of the value in its table.
+CURRENCY_PAIR_CODES = tuple(p.value for p in CurrencyPair)
+OPTION_TYPE_CODES = tuple(t.value for t in OptionType)
+NOTIONAL_CURRENCY_CODES = ('USD', 'JPY')
 
+PRICED_TRADE_DTYPE = [
+    ('pv', 'f8'),
+    ('delta', 'f8'),
+    ('vega', 'f8'),
+    ('notional', 'f8'),
+    ('strike', 'f8'),
+    ('spot', 'f8'),
+    ('time_to_expiry', 'f8'),
+    ('volatility', 'f8'),
+    ('currency_pair', 'u1'),
+    ('option_type', 'u1'),
+    ('notional_currency', 'u1')
+]
 
-class PricedTrade(BaseModel):
+_RECORD_CODE_TABLES = {
+    'currency_pair': CURRENCY_PAIR_CODES,
+    'option_type': OPTION_TYPE_CODES,
+    'notional_currency': NOTIONAL_CURRENCY_CODES
+}
+
+
+@dataclass(slots=True)
+class PricedTrade:
     """
     Trade with computed risk metrics.
     Output of the pricing engine.
+    
+    Plain slotted dataclass: values are produced internally by the
+    pricing engine, so no validation is needed.
     """
     trade_id: str
     currency_pair: str
@@ -89,17 +115,109 @@ class PricedTrade(BaseModel):
     spot: float
     time_to_expiry: float
     volatility: float
-    pv: float = Field(..., description="Present Value in notional currency")
-    delta: float = Field(..., description="Delta: sensitivity to spot rate")
-    vega: float = Field(..., description="Vega: sensitivity to volatility")
+    pv: float     # Present Value in notional currency
+    delta: float  # Delta: sensitivity to spot rate
+    vega: float   # Vega: sensitivity to volatility
+
+
+@dataclass(slots=True)
+class PricedTradeBatch:
+    """
+    Columnar (structure-of-arrays) collection of priced trades.
+    Output of the pricing engine.
+    
+    Each attribute is a NumPy array with one entry per trade, so the
+    aggregator and output writer work on whole columns. Indexing or
+    iterating yields PricedTrade rows.
+    """
+    trade_id: "np.ndarray"
+    currency_pair: "np.ndarray"
+    option_type: "np.ndarray"
+    strike: "np.ndarray"
+    notional: "np.ndarray"
+    notional_currency: "np.ndarray"
+    spot: "np.ndarray"
+    time_to_expiry: "np.ndarray"
+    volatility: "np.ndarray"
+    pv: "np.ndarray"
+    delta: "np.ndarray"
+    vega: "np.ndarray"
+    
+    STRING_FIELDS = ('trade_id', 'currency_pair', 'option_type', 'notional_currency')
+    
+    def __len__(self) -> int:
+        return len(self.trade_id)
+    
+    def __getitem__(self, i: int) -> PricedTrade:
+        return PricedTrade(
+            str(self.trade_id[i]),
+            str(self.currency_pair[i]),
+            str(self.option_type[i]),
+            float(self.strike[i]),
+            float(self.notional[i]),
+            str(self.notional_currency[i]),
+            float(self.spot[i]),
+            float(self.time_to_expiry[i]),
+            float(self.volatility[i]),
+            float(self.pv[i]),
+            float(self.delta[i]),
+            float(self.vega[i])
+        )
+    
+    def __iter__(self) -> Iterator[PricedTrade]:
+        for i in range(len(self)):
+            yield self[i]
     
-    class Config:
-        json_encoders = {
-            date: lambda v: v.isoformat()
-        }
+    @classmethod
+    def from_trades(cls, trades: Sequence[PricedTrade]) -> 'PricedTradeBatch':
+        """Build a batch from individual PricedTrade rows."""
+        import numpy as np
+        
+        n = len(trades)
+        columns = {}
+        for name in PricedTrade.__dataclass_fields__:
+            if name in cls.STRING_FIELDS:
+                columns[name] = np.array([getattr(t, name) for t in trades], dtype=str)
+            else:
+                columns[name] = np.fromiter(
+                    (getattr(t, name) for t in trades), dtype=np.float64, count=n
+                )
+        return cls(**columns)
+    
+    def to_records(self) -> "np.ndarray":
+        """
+        Pack the batch into a structured array with PRICED_TRADE_DTYPE.
+        
+        Trade IDs are not part of the record layout and are dropped.
+        
+        Raises:
+            ValueError: If a string field has a value with no code
+        """
+        import numpy as np
+        
+        records = np.empty(len(self), dtype=PRICED_TRADE_DTYPE)
+        for name, _ in PRICED_TRADE_DTYPE:
+            values = getattr(self, name)
+            table = _RECORD_CODE_TABLES.get(name)
+            if table is not None:
+                # Encode each distinct value once, then broadcast back
+                distinct, inverse = np.unique(values, return_inverse=True)
+                values = np.array([_record_code(table, v) for v in distinct.tolist()],
+                                  dtype=np.uint8)[inverse]
+            records[name] = values
+        return records
+
 
+def _record_code(table: Sequence[str], value: str) -> int:
+    """Code of value in one of the record code tables."""
+    try:
+        return table.index(value.upper())
+    except ValueError:
+        raise ValueError(f"No record code for value {value!r}") from None
 
-class PortfolioSummary(BaseModel):
+
+@dataclass(slots=True)
+class PortfolioSummary:
     """
     Aggregated portfolio-level risk metrics.
     """
@@ -109,11 +227,6 @@ class PortfolioSummary(BaseModel):
     total_vega: float
     valuation_date: date
     reporting_currency: str
-    
-    class Config:
-        json_encoders = {
-            date: lambda v: v.isoformat()
-        }
 
 
 class ValidationResult(BaseModel):
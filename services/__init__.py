@@ -1,11 +1,18 @@
 """
 Services package for FX Options Risk Aggregator.
+
+Service classes are resolved lazily (PEP 562) so importing the package
+does not pull in every service module and its dependencies.
 """
-from services.data_loader import DataLoaderService
-from services.validator import ValidationService
-from services.pricing_engine import PricingEngineService
-from services.aggregator import AggregationService
-from services.output_writer import OutputWriterService
+import importlib
+
+_SERVICE_MODULES = {
+    'DataLoaderService': 'services.data_loader',
+    'ValidationService': 'services.validator',
+    'PricingEngineService': 'services.pricing_engine',
+    'AggregationService': 'services.aggregator',
+    'OutputWriterService': 'services.output_writer',
+}
 
 __all__ = [
     'DataLoaderService',
@@ -13,4 +20,10 @@ __all__ = [
     'PricingEngineService',
     'AggregationService',
     'OutputWriterService'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _SERVICE_MODULES:
+        return getattr(importlib.import_module(_SERVICE_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,81 +1,131 @@
 """
 Aggregation service for computing portfolio-level metrics.
 """
-from typing import List
 from datetime import date
+from typing import TYPE_CHECKING, List, Union
 
-from models import PricedTrade, PortfolioSummary
+from models import (
+    PricedTrade, PricedTradeBatch, PortfolioSummary,
+    CURRENCY_PAIR_CODES, NOTIONAL_CURRENCY_CODES
+)
 
+if TYPE_CHECKING:
+    import numpy as np
 
-class AggregationService:
+
+def aggregate_portfolio(
+    priced_trades: Union[PricedTradeBatch, "np.ndarray", List[PricedTrade]],
+    valuation_date: date = None,
+    reporting_currency: str = "USD"
+) -> PortfolioSummary:
     """
-    Service responsible for aggregating trade-level results 
-    into portfolio-level risk metrics.
+    Aggregate priced trades into portfolio summary.
+    
+    Pure function of its arguments; AggregationService forwards to it.
+    
+    Args:
+        priced_trades: Batch, PRICED_TRADE_DTYPE record array, or list
+            of priced trades
+        valuation_date: Valuation date for the portfolio
+        reporting_currency: Currency to aggregate results into
+    
+    Returns:
+        PortfolioSummary with aggregated metrics
     """
+    if valuation_date is None:
+        valuation_date = date.today()
     
-    def aggregate_portfolio(
-        self, 
-        priced_trades: List[PricedTrade],
-        valuation_date: date = None,
-        reporting_currency: str = "USD"
-    ) -> PortfolioSummary:
-        """
-        Aggregate priced trades into portfolio summary.
-        
-        Args:
-            priced_trades: List of priced trades
-            valuation_date: Valuation date for the portfolio
-            reporting_currency: Currency to aggregate results into
-            
-        Returns:
-            PortfolioSummary with aggregated metrics
-        """
-        if valuation_date is None:
-            valuation_date = date.today()
-        
-        # Portfolio total sums
-        total_pv = 0.0
-        total_delta = 0.0
-        total_vega = 0.0
-        
-        for trade in priced_trades:
-            total_pv += self._to_reporting_currency(trade.pv, trade, reporting_currency)
-            total_delta += self._to_reporting_currency(trade.delta, trade, reporting_currency)
-            total_vega += self._to_reporting_currency(trade.vega, trade, reporting_currency)
-        
+    # Nothing to reduce: skip building and converting empty arrays
+    if not len(priced_trades):
         return PortfolioSummary(
-            total_trades=len(priced_trades),
-            total_pv=total_pv,
-            total_delta=total_delta,
-            total_vega=total_vega,
+            total_trades=0,
+            total_pv=0.0,
+            total_delta=0.0,
+            total_vega=0.0,
             valuation_date=valuation_date,
             reporting_currency=reporting_currency
         )
+    
+    import numpy as np
+    
+    if isinstance(priced_trades, np.ndarray):
+        columns = priced_trades.view(np.recarray)
+        # Decode only the two code columns the FX conversion needs
+        currency_pair = np.asarray(CURRENCY_PAIR_CODES)[priced_trades['currency_pair']]
+        notional_currency = np.asarray(NOTIONAL_CURRENCY_CODES)[priced_trades['notional_currency']]
+    else:
+        if not isinstance(priced_trades, PricedTradeBatch):
+            priced_trades = PricedTradeBatch.from_trades(priced_trades)
+        columns = priced_trades
+        currency_pair = priced_trades.currency_pair
+        notional_currency = priced_trades.notional_currency
+    
+    # Portfolio totals as dot products of metric and FX conversion vectors
+    factor = _conversion_factors(
+        currency_pair, notional_currency, columns.spot, reporting_currency
+    )
+    
+    return PortfolioSummary(
+        total_trades=len(priced_trades),
+        total_pv=float(columns.pv @ factor),
+        total_delta=float(columns.delta @ factor),
+        total_vega=float(columns.vega @ factor),
+        valuation_date=valuation_date,
+        reporting_currency=reporting_currency
+    )
 
-    def _to_reporting_currency(
-        self,
-        amount: float,
-        trade: PricedTrade,
-        reporting_currency: str
-    ) -> float:
-        """
-        Convert a trade amount into the reporting currency.
-        USD and JPY for USDJPY pairs; other pairs assumed USD notionals.
-        """
-        trade_ccy = trade.notional_currency.upper()
-        reporting_currency = reporting_currency.upper()
-        
-        # Reporting Currency
-        if trade_ccy == reporting_currency:
-            return amount
-        
-        # USD/JPY conversion using spot
-        if trade.currency_pair == "USDJPY":
-            if trade_ccy == "JPY" and reporting_currency == "USD":
-                return amount / trade.spot
-            if trade_ccy == "USD" and reporting_currency == "JPY":
-                return amount * trade.spot
-        
+
+def _conversion_factors(
+    pair: "np.ndarray",
+    notional_currency: "np.ndarray",
+    spot: "np.ndarray",
+    reporting_currency: str
+) -> "np.ndarray":
+    """
+    Per-trade factors converting notional-currency amounts into the
+    reporting currency.
+    USD and JPY for USDJPY pairs; other pairs assumed USD notionals.
+    
+    Raises:
+        ValueError: If a trade needs an unsupported conversion
+    """
+    import numpy as np
+    
+    reporting_currency = reporting_currency.upper()
+    trade_ccy = np.char.upper(notional_currency)
+    
+    # Reporting Currency
+    same_ccy = trade_ccy == reporting_currency
+    
+    # USD/JPY conversion using spot
+    is_usdjpy = pair == "USDJPY"
+    jpy_to_usd = is_usdjpy & (trade_ccy == "JPY") & (reporting_currency == "USD")
+    usd_to_jpy = is_usdjpy & (trade_ccy == "USD") & (reporting_currency == "JPY")
+    
+    unsupported = ~(same_ccy | jpy_to_usd | usd_to_jpy)
+    if unsupported.any():
+        i = int(np.argmax(unsupported))
         raise ValueError(
-            f"Unsupported conversion {trade_ccy}->{reporting_currency} for {trade.currency_pair}"
+            f"Unsupported conversion {trade_ccy[i]}->{reporting_currency} for {pair[i]}"
         )
+    
+    return np.where(same_ccy, 1.0, np.where(jpy_to_usd, 1.0 / spot, spot))
+
+
+class AggregationService:
+    """
+    Service responsible for aggregating trade-level results 
+    into portfolio-level risk metrics.
+    
+    Thin wrapper kept for API compatibility: the work is done by the
+    module-level aggregate_portfolio function.
+    """
+    
+    def aggregate_portfolio(
+        self,
+        priced_trades: Union[PricedTradeBatch, "np.ndarray", List[PricedTrade]],
+        valuation_date: date = None,
+        reporting_currency: str = "USD"
+    ) -> PortfolioSummary:
+        """Aggregate priced trades into portfolio summary (see aggregate_portfolio)."""
+        return aggregate_portfolio(priced_trades, valuation_date, reporting_currency)
\ No newline at end of file
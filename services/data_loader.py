@@ -2,11 +2,14 @@
 Data loading service for reading trade data from Excel files.
 """
 from pathlib import Path
-from typing import List
-import pandas as pd
+from typing import TYPE_CHECKING, List
 
 from models import RawTrade
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 
 class DataLoaderService:
     """
@@ -20,6 +23,11 @@ class DataLoaderService:
         'Expiry', 'OptionType'
     ]
     
+    NUMERIC_COLUMNS = [
+        'Notional', 'Spot', 'Strike', 'Vol',
+        'RateDomestic', 'RateForeign', 'Expiry'
+    ]
+    
     def load_from_excel(self, file_path: Path) -> List[RawTrade]:
         """
         Load trades from an Excel file.
@@ -34,11 +42,14 @@ class DataLoaderService:
             FileNotFoundError: If file doesn't exist
             ValueError: If required columns are missing
         """
+        # pandas is imported lazily to keep CLI start-up fast
+        import pandas as pd
+        
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        # Read Excel file
-        df = pd.read_excel(file_path, sheet_name=0)
+        # Read Excel file (calamine parses the workbook in Rust rather than Python)
+        df = pd.read_excel(file_path, sheet_name=0, engine='calamine')
         
         # Validate required columns
         missing_columns = set(self.REQUIRED_COLUMNS) - set(df.columns)
@@ -48,25 +59,62 @@ class DataLoaderService:
                 f"Required columns are: {self.REQUIRED_COLUMNS}"
             )
         
-        # Convert DataFrame rows to RawTrade objects
+        # Normalise text columns in bulk (map(str) keeps str() semantics for blanks)
+        trade_ids = df['TradeID'].map(str).str.strip().to_numpy()
+        underlyings = df['Underlying'].map(str).str.strip().to_numpy()
+        notional_ccys = df['NotionalCurrency'].map(str).str.strip().str.upper().to_numpy()
+        option_types = df['OptionType'].map(str).str.strip().str.upper().to_numpy()
+        
+        # Coerce numeric columns to float64 arrays in one go
+        numeric = {
+            column: self._to_float_array(df, column)
+            for column in self.NUMERIC_COLUMNS
+        }
+        notional = numeric['Notional']
+        spot = numeric['Spot']
+        strike = numeric['Strike']
+        vol = numeric['Vol']
+        rate_domestic = numeric['RateDomestic']
+        rate_foreign = numeric['RateForeign']
+        expiry = numeric['Expiry']
+        
         raw_trades = []
-        for idx, row in df.iterrows():
-            try:
-                trade = RawTrade(
-                    TradeID=str(row['TradeID']),
-                    Underlying=str(row['Underlying']).strip(),
-                    Notional=float(row['Notional']),
-                    NotionalCurrency=str(row['NotionalCurrency']).strip().upper(),
-                    Spot=float(row['Spot']),
-                    Strike=float(row['Strike']),
-                    Vol=float(row['Vol']),
-                    RateDomestic=float(row['RateDomestic']),
-                    RateForeign=float(row['RateForeign']),
-                    Expiry=float(row['Expiry']),
-                    OptionType=str(row['OptionType']).strip().upper()
-                )
-                raw_trades.append(trade)
-            except Exception as e:
-                raise ValueError(f"Error parsing row {idx + 2}: {e}")
+        for i in range(len(df)):
+            raw_trades.append(RawTrade(
+                TradeID=trade_ids[i],
+                Underlying=underlyings[i],
+                Notional=float(notional[i]),
+                NotionalCurrency=notional_ccys[i],
+                Spot=float(spot[i]),
+                Strike=float(strike[i]),
+                Vol=float(vol[i]),
+                RateDomestic=float(rate_domestic[i]),
+                RateForeign=float(rate_foreign[i]),
+                Expiry=float(expiry[i]),
+                OptionType=option_types[i]
+            ))
+        
+        return raw_trades
+    
+    @staticmethod
+    def _to_float_array(df: "pd.DataFrame", column: str) -> "np.ndarray":
+        """
+        Convert a DataFrame column to a float64 array.
         
-        return raw_trades
\ No newline at end of file
+        Raises:
+            ValueError: If any cell cannot be parsed as a number, reporting
+                the first offending Excel row
+        """
+        import numpy as np
+        import pandas as pd
+        
+        try:
+            return df[column].to_numpy(dtype=np.float64)
+        except (ValueError, TypeError):
+            coerced = pd.to_numeric(df[column], errors='coerce')
+            bad_rows = np.flatnonzero((coerced.isna() & df[column].notna()).to_numpy())
+            row = bad_rows[0]
+            raise ValueError(
+                f"Error parsing row {row + 2}: "
+                f"invalid {column} value {df[column].iloc[row]!r}"
+            )
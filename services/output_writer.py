@@ -2,20 +2,28 @@
 Output writer service for exporting results to Excel.
 """
 from pathlib import Path
-from typing import List
-import pandas as pd
+from typing import Dict, List, Sequence
 
-from models import PricedTrade, PortfolioSummary
+from models import PricedTradeBatch, PortfolioSummary
 
 
 class OutputWriterService:
     """
     Service responsible for writing results to output files.
+    
+    Sheets are streamed row by row with xlsxwriter's constant_memory mode,
+    so memory stays flat regardless of portfolio size.
     """
     
+    # Column width cap, in characters
+    MAX_COLUMN_WIDTH = 50
+    
+    # Same look as the pandas to_excel header row
+    HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+    
     def write_results(
         self,
-        priced_trades: List[PricedTrade],
+        priced_trades: PricedTradeBatch,
         portfolio_summary: PortfolioSummary,
         output_file: Path
     ) -> None:
@@ -23,31 +31,31 @@ class OutputWriterService:
         Write priced trades and portfolio summary to Excel file.
         
         Args:
-            priced_trades: List of priced trades
+            priced_trades: Batch of priced trades
             portfolio_summary: Portfolio aggregated metrics
             output_file: Path to output Excel file
         """
-        # Convert priced trades to DataFrame
-        trades_data = []
-        for trade in priced_trades:
-            trades_data.append({
-                'TradeID': trade.trade_id,
-                'CurrencyPair': trade.currency_pair,
-                'OptionType': trade.option_type,
-                'Strike': trade.strike,
-                'Notional': trade.notional,
-                'NotionalCurrency': trade.notional_currency,
-                'Spot': trade.spot,
-                'TimeToExpiry': trade.time_to_expiry,
-                'Volatility': trade.volatility,
-                'PV': round(trade.pv, 2),
-                'Delta': round(trade.delta, 2),
-                'Vega': round(trade.vega, 2)
-            })
+        # numpy/xlsxwriter are imported lazily to keep CLI start-up fast
+        import numpy as np
+        import xlsxwriter
         
-        df_trades = pd.DataFrame(trades_data)
+        # Trade results, column-wise from the batch arrays
+        trades_data = {
+            'TradeID': priced_trades.trade_id,
+            'CurrencyPair': priced_trades.currency_pair,
+            'OptionType': priced_trades.option_type,
+            'Strike': priced_trades.strike,
+            'Notional': priced_trades.notional,
+            'NotionalCurrency': priced_trades.notional_currency,
+            'Spot': priced_trades.spot,
+            'TimeToExpiry': priced_trades.time_to_expiry,
+            'Volatility': priced_trades.volatility,
+            'PV': np.round(priced_trades.pv, 2),
+            'Delta': np.round(priced_trades.delta, 2),
+            'Vega': np.round(priced_trades.vega, 2)
+        }
         
-        # Portfolio summary DataFrame
+        # Portfolio summary
         summary_data = {
             'Metric': [
                 'Total Trades',
@@ -64,24 +72,34 @@ class OutputWriterService:
                 portfolio_summary.valuation_date.isoformat()
             ]
         }
-        df_summary = pd.DataFrame(summary_data)
         
-        # Write to Excel 
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            df_trades.to_excel(writer, sheet_name='Trade_Results', index=False)
-            df_summary.to_excel(writer, sheet_name='Portfolio_Summary', index=False)
-            
-            # Column width adjustments
-            for sheet_name in writer.sheets:
-                worksheet = writer.sheets[sheet_name]
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+        # Write to Excel
+        workbook = xlsxwriter.Workbook(str(output_file), {'constant_memory': True})
+        try:
+            header_format = workbook.add_format(self.HEADER_FORMAT)
+            sheets = {'Trade_Results': trades_data, 'Portfolio_Summary': summary_data}
+            for sheet_name, columns in sheets.items():
+                worksheet = workbook.add_worksheet(sheet_name)
+                
+                # Column widths must be set before rows are flushed to disk
+                for col_idx, width in enumerate(self._column_widths(columns)):
+                    worksheet.set_column(col_idx, col_idx, width)
+                
+                worksheet.write_row(0, 0, list(columns), header_format)
+                for row_idx, row in enumerate(zip(*columns.values()), start=1):
+                    worksheet.write_row(row_idx, 0, row)
+        finally:
+            workbook.close()
+    
+    def _column_widths(self, columns: Dict[str, Sequence]) -> List[int]:
+        """
+        Display width for each column: longest value or header plus
+        padding, capped at MAX_COLUMN_WIDTH.
+        """
+        import numpy as np
+        
+        widths = []
+        for header, values in columns.items():
+            longest = int(np.char.str_len(np.asarray(values).astype(str)).max()) if len(values) else 0
+            widths.append(min(max(longest, len(header)) + 2, self.MAX_COLUMN_WIDTH))
+        return widths
@@ -2,11 +2,59 @@
 Pricing engine service for FX options using Black-Scholes model.
 Computes PV, Delta, and Vega for validated trades.
 """
-from typing import List
-import numpy as np
-from scipy.stats import norm
+from typing import TYPE_CHECKING, List
 
-from models import ValidatedTrade, PricedTrade, OptionType
+from models import ValidatedTrade, PricedTradeBatch, OptionType
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def price_portfolio_parallel(
+    S: "np.ndarray",
+    K: "np.ndarray",
+    T: "np.ndarray",
+    sigma: "np.ndarray",
+    rd: "np.ndarray",
+    rf: "np.ndarray",
+    is_call: "np.ndarray",
+    notional: "np.ndarray",
+    approximate_cdf: bool = False
+) -> "np.ndarray":
+    """
+    Price a portfolio given as one array per market input.
+    
+    Runs the fused batch kernel, which is compiled with numba and split
+    across cores (prange) when numba is installed. Useful for benchmarks
+    and callers that already hold structure-of-arrays data.
+    
+    Args:
+        S, K, T, sigma, rd, rf, notional: Per-trade spot, strike, time to
+            expiry, volatility, domestic and foreign rates and notional
+        is_call: Per-trade flag, True for calls
+        approximate_cdf: Use the Abramowitz & Stegun normal CDF
+        
+    Returns:
+        Array of shape (3, n) holding the PV, Delta and Vega rows, so it
+        unpacks as (pv, delta, vega)
+    """
+    import numpy as np
+    from services.pricing_kernels import price_bsgk
+    
+    S, K, T, sigma, rd, rf, notional = (
+        np.ascontiguousarray(x, dtype=np.float64) for x in (S, K, T, sigma, rd, rf, notional)
+    )
+    is_call = np.ascontiguousarray(is_call, dtype=np.bool_)
+    
+    # Each row of a C-ordered array is contiguous, so the kernel writes
+    # straight into the result
+    out = np.empty((3, S.shape[0]))
+    if S.shape[0]:
+        price_bsgk(
+            S, K, T, rd, rf, sigma, notional, is_call, out[0], out[1], out[2],
+            approximate_cdf
+        )
+    return out
 
 
 class PricingEngineService:
@@ -28,62 +76,114 @@ class PricingEngineService:
     - d2 = d1 - σ * sqrt(T)
     """
     
-    def price_portfolio(self, trades: List[ValidatedTrade]) -> List[PricedTrade]:
+    def __init__(self, approximate_cdf: bool = False):
+        """
+        Args:
+            approximate_cdf: Use the Abramowitz & Stegun normal CDF
+                approximation (CDF abs error < 7.5e-8) in the batch and scalar
+                kernels instead of the exact erfc/ndtr evaluation
+        """
+        # Imported here so the engine module itself stays lightweight; bound
+        # once so the scalar path does no per-call import lookup
+        from services.pricing_kernels import SCALAR_PRICERS
+        
+        self.approximate_cdf = approximate_cdf
+        self._scalar_pricers = SCALAR_PRICERS
+    
+    def price_portfolio(self, trades: List[ValidatedTrade]) -> PricedTradeBatch:
         """
         Price a portfolio of validated trades.
         
+        Trade attributes are gathered into NumPy arrays and priced in a
+        single fused kernel call (see services.pricing_kernels).
+        
         Args:
             trades: List of validated trades
             
         Returns:
-            List of priced trades with PV, Delta, and Vega
+            Columnar batch of priced trades with PV, Delta, and Vega
+        """
+        import numpy as np
+        
+        inputs = self._market_arrays(trades)
+        S, K, T, _, _, sigma, N, _ = inputs
+        pv, delta, vega = self._price_arrays(*inputs)
+        
+        return PricedTradeBatch(
+            trade_id=np.array([t.trade_id for t in trades], dtype=str),
+            currency_pair=np.array([t.currency_pair.value for t in trades], dtype=str),
+            option_type=np.array([t.option_type.value for t in trades], dtype=str),
+            strike=K,
+            notional=N,
+            notional_currency=np.array([t.notional_currency for t in trades], dtype=str),
+            spot=S,
+            time_to_expiry=T,
+            volatility=sigma,
+            pv=pv,
+            delta=delta,
+            vega=vega
+        )
+    
+    def price_trades(self, trades: List[ValidatedTrade]) -> "np.ndarray":
         """
-        priced_trades = []
+        Price trades in one vectorised call, without building a result batch.
         
-        for trade in trades:
-            pv = self._calculate_pv(trade)
-            delta = self._calculate_delta(trade)
-            vega = self._calculate_vega(trade)
-            
-            priced_trade = PricedTrade(
-                trade_id=trade.trade_id,
-                currency_pair=trade.currency_pair.value,
-                option_type=trade.option_type.value,
-                strike=trade.strike,
-                notional=trade.notional,
-                notional_currency=trade.notional_currency,
-                spot=trade.spot,
-                time_to_expiry=trade.time_to_expiry,
-                volatility=trade.volatility,
-                pv=pv,
-                delta=delta,
-                vega=vega
-            )
-            priced_trades.append(priced_trade)
-        
-        return priced_trades
+        Args:
+            trades: List of validated trades
+        
+        Returns:
+            Array of shape (3, len(trades)) holding the PV, Delta and Vega rows
+        """
+        return self._price_arrays(*self._market_arrays(trades))
+    
+    @staticmethod
+    def _market_arrays(trades: List[ValidatedTrade]) -> tuple:
+        """
+        Structure-of-arrays view of the trades, built in a single pass.
+        
+        Returns:
+            Contiguous float64 arrays (S, K, T, r_d, r_f, sigma, N) followed
+            by the boolean is_call mask
+        """
+        import numpy as np
+        
+        CALL = OptionType.CALL
+        inputs = np.array(
+            [
+                (t.spot, t.strike, t.time_to_expiry, t.domestic_rate,
+                 t.foreign_rate, t.volatility, t.notional, t.option_type is CALL)
+                for t in trades
+            ],
+            dtype=np.float64
+        ).reshape(-1, 8)
+        S, K, T, r_d, r_f, sigma, N, call_flag = np.ascontiguousarray(inputs.T)
+        return S, K, T, r_d, r_f, sigma, N, call_flag != 0.0
     
-    def _calculate_d1_d2(self, trade: ValidatedTrade) -> tuple[float, float]:
+    def _price_arrays(self, S, K, T, r_d, r_f, sigma, N, is_call) -> "np.ndarray":
         """
-        Calculate d1 and d2 parameters for Black-Scholes formula.
+        Run the batch kernel over market arrays via price_portfolio_parallel.
+        
+        Returns:
+            Array of shape (3, n) holding the PV, Delta and Vega rows
+        """
+        return price_portfolio_parallel(
+            S, K, T, sigma, r_d, r_f, is_call, N, self.approximate_cdf
+        )
+    
+    def _price_trade(self, trade: ValidatedTrade) -> tuple[float, float, float]:
+        """
+        Unpack a trade and price it with the scalar pricing kernel.
         
         Args:
             trade: Validated trade
             
         Returns:
-            Tuple of (d1, d2)
+            Tuple of (pv, delta, vega)
         """
-        S = trade.spot
-        K = trade.strike
-        T = trade.time_to_expiry
-        r_d = trade.domestic_rate
-        r_f = trade.foreign_rate
-        sigma = trade.volatility
-        
-        d1 = (np.log(S / K) + (r_d - r_f + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
-        
-        return d1, d2
+        return self._scalar_pricers[trade.option_type](
+            trade.spot, trade.strike, trade.time_to_expiry, trade.domestic_rate,
+            trade.foreign_rate, trade.volatility, trade.notional, self.approximate_cdf
+        )
     
     def _calculate_pv(self, trade: ValidatedTrade) -> float:
         """
@@ -95,30 +195,7 @@ class PricingEngineService:
         Returns:
             Present value in notional currency
         """
-        S = trade.spot
-        K = trade.strike
-        T = trade.time_to_expiry
-        r_d = trade.domestic_rate
-        r_f = trade.foreign_rate
-        N = trade.notional
-        
-        d1, d2 = self._calculate_d1_d2(trade)
-        
-        # Discount factors
-        df_domestic = np.exp(-r_d * T)
-        df_foreign = np.exp(-r_f * T)
-        
-        if trade.option_type == OptionType.CALL:
-            # Call option: S * exp(-r_f * T) * N(d1) - K * exp(-r_d * T) * N(d2)
-            pv_per_unit = S * df_foreign * norm.cdf(d1) - K * df_domestic * norm.cdf(d2)
-        else:  # PUT
-            # Put option: K * exp(-r_d * T) * N(-d2) - S * exp(-r_f * T) * N(-d1)
-            pv_per_unit = K * df_domestic * norm.cdf(-d2) - S * df_foreign * norm.cdf(-d1)
-        
-        # Multiplying by notional
-        pv = pv_per_unit * N
-        
-        return pv
+        return self._price_trade(trade)[0]
     
     def _calculate_delta(self, trade: ValidatedTrade) -> float:
         """
@@ -132,26 +209,7 @@ class PricingEngineService:
         Returns:
             Delta in notional currency per unit move in spot
         """
-        T = trade.time_to_expiry
-        r_f = trade.foreign_rate
-        N = trade.notional
-        
-        d1, _ = self._calculate_d1_d2(trade)
-        
-        # Discount factor for foreign currency
-        df_foreign = np.exp(-r_f * T)
-        
-        if trade.option_type == OptionType.CALL:
-            # Call delta: exp(-r_f * T) * N(d1)
-            delta_per_unit = df_foreign * norm.cdf(d1)
-        else:  # PUT
-            # Put delta: -exp(-r_f * T) * N(-d1) = exp(-r_f * T) * (N(d1) - 1)
-            delta_per_unit = df_foreign * (norm.cdf(d1) - 1)
-        
-        # Multiply by notional
-        delta = delta_per_unit * N
-        
-        return delta
+        return self._price_trade(trade)[1]
     
     def _calculate_vega(self, trade: ValidatedTrade) -> float:
         """
@@ -167,22 +225,4 @@ class PricingEngineService:
         Returns:
             Vega in notional currency per 1% change in volatility
         """
-        S = trade.spot
-        T = trade.time_to_expiry
-        r_f = trade.foreign_rate
-        N = trade.notional
-        
-        d1, _ = self._calculate_d1_d2(trade)
-        
-        # Discount factor for foreign currency
-        df_foreign = np.exp(-r_f * T)
-        
-        # Vega is the same for calls and puts
-        # Vega = S * exp(-r_f * T) * n(d1) * sqrt(T)
-        # where n(d1) is the standard normal PDF
-        vega_per_unit = S * df_foreign * norm.pdf(d1) * np.sqrt(T)
-        
-        # Multiply by notional and dividing by 100 to express per 1% change in volatility
-        vega = vega_per_unit * N / 100
-        
-        return vega
\ No newline at end of file
+        return self._price_trade(trade)[2]
\ No newline at end of file
@@ -2,20 +2,51 @@
 Validation service for trade data.
 Transforms and validates raw trades into validated trades.
 """
-from typing import List
+import re
+from typing import Dict, List, Tuple
 
 from models import RawTrade, ValidatedTrade, ValidationResult, OptionType, CurrencyPair
 
 
+# Canonical value -> enum member, for membership tests without exceptions
+_VALID_OPTION_TYPES: Dict[str, OptionType] = {t.value: t for t in OptionType}
+_VALID_PAIRS: Dict[str, CurrencyPair] = {p.value: p for p in CurrencyPair}
+
+# Raw input spelling -> enum member. Portfolios repeat a handful of spellings
+# ("CALL", "EUR/USD", ...), so normalisation runs once per distinct value.
+# Only successful lookups are cached.
+_OPTION_TYPE_CACHE: Dict[str, OptionType] = dict(_VALID_OPTION_TYPES)
+_CURRENCY_PAIR_CACHE: Dict[str, CurrencyPair] = {}
+
+# Separators removed when normalising a currency pair ("EUR / USD" -> "EURUSD")
+_PAIR_SEPARATORS = re.compile(r"[\s/]")
+
+# Numeric range checks as (RawTrade field, array predicate, error message),
+# evaluated as NumPy masks over the whole batch. A trade failing several
+# rules reports the first one. NaN fails every predicate.
+_NUMERIC_RULES = (
+    ('Strike', lambda x: x > 0, "Strike must be positive, got {value}"),
+    ('Expiry', lambda x: x > 0, "Expiry must be positive, got {value}"),
+    ('Vol', lambda x: x > 0, "Vol must be positive, got {value}"),
+    ('Notional', lambda x: x > 0, "Notional must be positive, got {value}"),
+    ('Spot', lambda x: x > 0, "Spot must be positive, got {value}"),
+    ('Expiry', lambda x: x <= 10.0, "Expiry must be at most 10 years, got {value}"),
+    ('Vol', lambda x: x <= 1.0, "Volatility {value:.2%} seems unreasonably high"),
+    ('RateDomestic', lambda x: (x >= -0.1) & (x <= 1.0),
+     "RateDomestic must be between -0.1 and 1.0, got {value}"),
+    ('RateForeign', lambda x: (x >= -0.1) & (x <= 1.0),
+     "RateForeign must be between -0.1 and 1.0, got {value}"),
+)
+
+_VALID_NOTIONAL_CURRENCIES = ('USD', 'JPY')
+
+
 class ValidationService:
     """
     Service responsible for validating and transforming raw trade data.
     Performs field-level and business logic validation.
     """
     
-    def __init__(self):
-        pass
-    
     def validate_trades(self, raw_trades: List[RawTrade]) -> ValidationResult:
         """
         Validate a list of raw trades.
@@ -26,72 +57,117 @@ class ValidationService:
         Returns:
             ValidationResult containing valid trades and any errors
         """
-        valid_trades = []
-        errors = []
+        errors: List[Tuple[int, str]] = []
+        
+        # Range checks on the numeric fields, vectorised across the batch
+        in_range = self._numeric_mask(raw_trades, errors)
         
-        for raw_trade in raw_trades:
+        # Parse enums and build trades one by one
+        valid_trades: List[ValidatedTrade] = []
+        build = self._build_trade
+        for i, raw_trade in enumerate(raw_trades):
+            if not in_range[i]:
+                continue
             try:
-                validated_trade = self._validate_single_trade(raw_trade)
-                valid_trades.append(validated_trade)
+                valid_trades.append(build(raw_trade))
             except Exception as e:
-                error_msg = f"Trade {raw_trade.TradeID}: {str(e)}"
-                errors.append(error_msg)
+                errors.append((i, f"Trade {raw_trade.TradeID}: {str(e)}"))
+        
+        # Report errors in input order
+        errors.sort(key=lambda item: item[0])
+        return ValidationResult.model_construct(
+            valid_trades=valid_trades,
+            errors=[msg for _, msg in errors]
+        )
+    
+    @staticmethod
+    def _numeric_mask(
+        raw_trades: List[RawTrade],
+        errors: List[Tuple[int, str]]
+    ) -> List[bool]:
+        """
+        Apply _NUMERIC_RULES to the whole batch as NumPy masks.
+        
+        Only the failing trades are visited in Python, to append an error
+        (keyed by input index) for the first rule they break.
         
-        return ValidationResult(valid_trades=valid_trades, errors=errors)
+        Returns:
+            Per-trade flags, True where every rule passes
+        """
+        import numpy as np
+        
+        n = len(raw_trades)
+        columns = {
+            name: np.fromiter((getattr(t, name) for t in raw_trades), np.float64, n)
+            for name in dict.fromkeys(name for name, _, _ in _NUMERIC_RULES)
+        }
+        passed = [check(columns[name]) for name, check, _ in _NUMERIC_RULES]
+        in_range = np.logical_and.reduce(passed)
+        
+        for i in np.flatnonzero(~in_range).tolist():
+            raw_trade = raw_trades[i]
+            name, _, message = next(
+                rule for rule, ok in zip(_NUMERIC_RULES, passed) if not ok[i]
+            )
+            errors.append(
+                (i, f"Trade {raw_trade.TradeID}: "
+                    f"{message.format(value=getattr(raw_trade, name))}")
+            )
+        return in_range.tolist()
     
-    def _validate_single_trade(self, raw_trade: RawTrade) -> ValidatedTrade:
+    @staticmethod
+    def _build_trade(raw_trade: RawTrade) -> ValidatedTrade:
         """
-        Validate and transform a single raw trade.
+        Parse the enum fields of a range-checked raw trade and build it.
         
         Args:
             raw_trade: Raw trade data
             
         Returns:
-            ValidatedTrade object
+            ValidatedTrade ready for pricing
             
         Raises:
             ValueError: If validation fails
         """
-        # Parse and validate option type 
-        option_type_str = raw_trade.OptionType.upper()
-        try:
-            option_type = OptionType(option_type_str)
-        except ValueError:
-            raise ValueError(
-                f"Invalid OptionType '{raw_trade.OptionType}'. "
-                f"Must be one of: {[t.value for t in OptionType]}"
-            )
-        
-        # Parse and validate currency pair
-        currency_pair_normalized = raw_trade.Underlying.replace("/", "").replace(" ", "").upper()
-        try:
-            currency_pair = CurrencyPair(currency_pair_normalized)
-        except ValueError:
-            raise ValueError(
-                f"Invalid Underlying '{raw_trade.Underlying}'. "
-                f"Must be one of: EUR/USD, GBP/USD, or USD/JPY"
-            )
+        # Parse and validate option type (memoised per raw spelling)
+        option_type = _OPTION_TYPE_CACHE.get(raw_trade.OptionType)
+        if option_type is None:
+            option_type = _VALID_OPTION_TYPES.get(raw_trade.OptionType.upper())
+            if option_type is None:
+                raise ValueError(
+                    f"Invalid OptionType '{raw_trade.OptionType}'. "
+                    f"Must be one of: {[t.value for t in OptionType]}"
+                )
+            _OPTION_TYPE_CACHE[raw_trade.OptionType] = option_type
         
-        # Validate time to expiry
-        if raw_trade.Expiry <= 0:
-            raise ValueError(f"Expiry must be positive, got {raw_trade.Expiry}")
+        # Parse and validate currency pair (memoised per raw spelling)
+        currency_pair = _CURRENCY_PAIR_CACHE.get(raw_trade.Underlying)
+        if currency_pair is None:
+            currency_pair_normalized = _PAIR_SEPARATORS.sub("", raw_trade.Underlying).upper()
+            currency_pair = _VALID_PAIRS.get(currency_pair_normalized)
+            if currency_pair is None:
+                raise ValueError(
+                    f"Invalid Underlying '{raw_trade.Underlying}'. "
+                    f"Must be one of: EUR/USD, GBP/USD, or USD/JPY"
+                )
+            _CURRENCY_PAIR_CACHE[raw_trade.Underlying] = currency_pair
         
-        # Create validated trade
-        try:
-            validated_trade = ValidatedTrade(
-                trade_id=raw_trade.TradeID,
-                currency_pair=currency_pair,
-                option_type=option_type,
-                strike=raw_trade.Strike,
-                notional=raw_trade.Notional,
-                notional_currency=raw_trade.NotionalCurrency,
-                time_to_expiry=raw_trade.Expiry,
-                spot=raw_trade.Spot,
-                volatility=raw_trade.Vol,
-                domestic_rate=raw_trade.RateDomestic,
-                foreign_rate=raw_trade.RateForeign
+        # Ensure notional currency is one we can aggregate
+        if raw_trade.NotionalCurrency not in _VALID_NOTIONAL_CURRENCIES:
+            raise ValueError(
+                f"NotionalCurrency must be USD or JPY, got {raw_trade.NotionalCurrency}"
             )
-        except Exception as e:
-            raise ValueError(f"Validation error: {str(e)}")
         
-        return validated_trade
\ No newline at end of file
+        return ValidatedTrade(
+            trade_id=raw_trade.TradeID,
+            currency_pair=currency_pair,
+            option_type=option_type,
+            strike=raw_trade.Strike,
+            notional=raw_trade.Notional,
+            notional_currency=raw_trade.NotionalCurrency,
+            time_to_expiry=raw_trade.Expiry,
+            spot=raw_trade.Spot,
+            volatility=raw_trade.Vol,
+            domestic_rate=raw_trade.RateDomestic,
+            foreign_rate=raw_trade.RateForeign
+        )
\ No newline at end of file
@@ -2,31 +2,35 @@
 Unit tests for FX Options Risk Aggregator.
 Tests pricing, validation, and aggregation logic.
 """
+import math
+import random
 import unittest
+from dataclasses import replace
 from datetime import date
-import numpy as np
-from scipy.stats import norm
 
 from models import (
     ValidatedTrade, OptionType, CurrencyPair, 
     RawTrade, PortfolioSummary
 )
 from services.validator import ValidationService
-from services.pricing_engine import PricingEngineService
-from services.aggregator import AggregationService
+from services.pricing_engine import PricingEngineService, price_portfolio_parallel
+from services.aggregator import AggregationService, aggregate_portfolio
+
+
+# Services hold no per-call state, so one instance of each is shared by all tests
+_PRICING = PricingEngineService()
+_VALIDATOR = ValidationService()
+_AGGREGATOR = AggregationService()
 
 
 class TestBlackScholesPricing(unittest.TestCase):
     """Test Black-Scholes pricing calculations."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.pricing_engine = PricingEngineService()
-    
-    def test_atm_call_option(self):
-        """Test pricing of at-the-money call option."""
-        trade = ValidatedTrade(
-            trade_id="TEST001",
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared ATM call template."""
+        cls._atm = ValidatedTrade(
+            trade_id="ATM",
             currency_pair=CurrencyPair.EURUSD,
             option_type=OptionType.CALL,
             strike=1.1000,
@@ -38,8 +42,12 @@ class TestBlackScholesPricing(unittest.TestCase):
             domestic_rate=0.05,
             foreign_rate=0.03
         )
+    
+    def test_atm_call_option(self):
+        """Test pricing of at-the-money call option."""
+        trade = replace(self._atm, trade_id="TEST001")
         
-        pv = self.pricing_engine._calculate_pv(trade)
+        pv = _PRICING._calculate_pv(trade)
         
         # ATM call should have positive value
         self.assertGreater(pv, 0)
@@ -49,45 +57,30 @@ class TestBlackScholesPricing(unittest.TestCase):
     
     def test_deep_itm_call_option(self):
         """Test pricing of deep in-the-money call option."""
-        trade = ValidatedTrade(
+        trade = replace(
+            self._atm,
             trade_id="TEST002",
-            currency_pair=CurrencyPair.EURUSD,
-            option_type=OptionType.CALL,
-            strike=1.0000,
-            notional=1_000_000,
-            notional_currency="USD",
-            time_to_expiry=0.5,  # 6 months
-            spot=1.1000,  # 10% ITM
-            volatility=0.10,
-            domestic_rate=0.05,
-            foreign_rate=0.03
+            strike=1.0000  # 10% ITM
         )
         
-        pv = self.pricing_engine._calculate_pv(trade)
+        pv = _PRICING._calculate_pv(trade)
         
         # ITM call should be worth approximately intrinsic value, just a guardrail test to catch any model regresions
         # Intrinsic = (Spot - Strike) * Notional = 0.10 * 1M = 100k
         # With discounting and foreign rate, should be close
         self.assertGreater(pv, 90_000)
-        self.assertAlmostEqual(pv, 110_500, delta=5_000)
+        self.assertTrue(math.isclose(pv, 110_500, abs_tol=5_000), pv)
     
     def test_otm_put_option(self):
         """Test pricing of out-of-the-money put option."""
-        trade = ValidatedTrade(
+        trade = replace(
+            self._atm,
             trade_id="TEST003",
-            currency_pair=CurrencyPair.EURUSD,
             option_type=OptionType.PUT,
-            strike=1.0000,
-            notional=1_000_000,
-            notional_currency="USD",
-            time_to_expiry=0.5,  # 6 months
-            spot=1.1000,  # 10% OTM
-            volatility=0.10,
-            domestic_rate=0.05,
-            foreign_rate=0.03
+            strike=1.0000  # 10% OTM
         )
         
-        pv = self.pricing_engine._calculate_pv(trade)
+        pv = _PRICING._calculate_pv(trade)
         
         # OTM put should have positive time value but less than ATM
         self.assertGreater(pv, 0)
@@ -95,21 +88,9 @@ class TestBlackScholesPricing(unittest.TestCase):
     
     def test_call_delta_positive(self):
         """Test that call options have positive delta."""
-        trade = ValidatedTrade(
-            trade_id="TEST004",
-            currency_pair=CurrencyPair.EURUSD,
-            option_type=OptionType.CALL,
-            strike=1.1000,
-            notional=1_000_000,
-            notional_currency="USD",
-            time_to_expiry=0.5,
-            spot=1.1000,
-            volatility=0.10,
-            domestic_rate=0.05,
-            foreign_rate=0.03
-        )
+        trade = replace(self._atm, trade_id="TEST004")
         
-        delta = self.pricing_engine._calculate_delta(trade)
+        delta = _PRICING._calculate_delta(trade)
         
         # Call delta should be positive
         self.assertGreater(delta, 0)
@@ -119,21 +100,9 @@ class TestBlackScholesPricing(unittest.TestCase):
     
     def test_put_delta_negative(self):
         """Test that put options have negative delta."""
-        trade = ValidatedTrade(
-            trade_id="TEST005",
-            currency_pair=CurrencyPair.EURUSD,
-            option_type=OptionType.PUT,
-            strike=1.1000,
-            notional=1_000_000,
-            notional_currency="USD",
-            time_to_expiry=0.5,
-            spot=1.1000,
-            volatility=0.10,
-            domestic_rate=0.05,
-            foreign_rate=0.03
-        )
+        trade = replace(self._atm, trade_id="TEST005", option_type=OptionType.PUT)
         
-        delta = self.pricing_engine._calculate_delta(trade)
+        delta = _PRICING._calculate_delta(trade)
         
         # Put delta should be negative
         self.assertLess(delta, 0)
@@ -144,21 +113,9 @@ class TestBlackScholesPricing(unittest.TestCase):
     def test_vega_positive(self):
         """Test that vega is always positive for both calls and puts."""
         for option_type in [OptionType.CALL, OptionType.PUT]:
-            trade = ValidatedTrade(
-                trade_id="TEST006",
-                currency_pair=CurrencyPair.EURUSD,
-                option_type=option_type,
-                strike=1.1000,
-                notional=1_000_000,
-                notional_currency="USD",
-                time_to_expiry=0.5,
-                spot=1.1000,
-                volatility=0.10,
-                domestic_rate=0.05,
-                foreign_rate=0.03
-            )
+            trade = replace(self._atm, trade_id="TEST006", option_type=option_type)
             
-            vega = self.pricing_engine._calculate_vega(trade)
+            vega = _PRICING._calculate_vega(trade)
             
             # Vega should always be positive
             self.assertGreater(vega, 0)
@@ -174,79 +131,143 @@ class TestBlackScholesPricing(unittest.TestCase):
         r_d = 0.05
         r_f = 0.03
         
-        call_trade = ValidatedTrade(
+        call_trade = replace(
+            self._atm,
             trade_id="CALL",
-            currency_pair=CurrencyPair.EURUSD,
-            option_type=OptionType.CALL,
             strike=strike,
-            notional=1_000_000,
-            notional_currency="USD",
             time_to_expiry=T,
             spot=spot,
-            volatility=0.10,
             domestic_rate=r_d,
             foreign_rate=r_f
         )
         
-        put_trade = ValidatedTrade(
+        put_trade = replace(
+            self._atm,
             trade_id="PUT",
-            currency_pair=CurrencyPair.EURUSD,
             option_type=OptionType.PUT,
             strike=strike,
-            notional=1_000_000,
-            notional_currency="USD",
             time_to_expiry=T,
             spot=spot,
-            volatility=0.10,
             domestic_rate=r_d,
             foreign_rate=r_f
         )
         
-        call_pv = self.pricing_engine._calculate_pv(call_trade)
-        put_pv = self.pricing_engine._calculate_pv(put_trade)
+        call_pv = _PRICING._calculate_pv(call_trade)
+        put_pv = _PRICING._calculate_pv(put_trade)
         
         # Calculate theoretical difference
         expected_diff = (
-            spot * np.exp(-r_f * T) - strike * np.exp(-r_d * T)
+            spot * math.exp(-r_f * T) - strike * math.exp(-r_d * T)
         ) * 1_000_000
         
         actual_diff = call_pv - put_pv
         
         # Should match within small tolerance
-        self.assertAlmostEqual(actual_diff, expected_diff, places=0)
+        self.assertTrue(
+            math.isclose(actual_diff, expected_diff, abs_tol=0.5),
+            (actual_diff, expected_diff)
+        )
     
     def test_zero_volatility_edge_case(self):
         """Test behavior with very low volatility."""
-        trade = ValidatedTrade(
+        trade = replace(
+            self._atm,
             trade_id="TEST007",
-            currency_pair=CurrencyPair.EURUSD,
-            option_type=OptionType.CALL,
-            strike=1.1000,
-            notional=1_000_000,
-            notional_currency="USD",
-            time_to_expiry=0.5,
-            spot=1.1000,
-            volatility=0.001,  # Very low vol
-            domestic_rate=0.05,
-            foreign_rate=0.03
+            volatility=0.001  # Very low vol
         )
         
-        pv = self.pricing_engine._calculate_pv(trade)
+        pv = _PRICING._calculate_pv(trade)
         
         # Should still produce a valid price
         self.assertGreater(pv, 0)
         self.assertIsInstance(pv, float)
-        self.assertFalse(np.isnan(pv))
-        self.assertFalse(np.isinf(pv))
+        self.assertFalse(math.isnan(pv))
+        self.assertFalse(math.isinf(pv))
+    
+    def test_batched_pricing_matches_scalar(self):
+        """Test that the batched pricing path matches per-trade pricing."""
+        trades = [
+            replace(
+                self._atm,
+                trade_id=f"TEST{i:03d}",
+                option_type=option_type,
+                strike=strike
+            )
+            for i, (option_type, strike) in enumerate([
+                (OptionType.CALL, 1.0000),
+                (OptionType.CALL, 1.2000),
+                (OptionType.PUT, 1.0000),
+                (OptionType.PUT, 1.2000)
+            ])
+        ]
+        
+        pv, delta, vega = _PRICING.price_trades(trades)
+        
+        for i, trade in enumerate(trades):
+            with self.subTest(trade=trade.trade_id):
+                self.assertAlmostEqual(pv[i], _PRICING._calculate_pv(trade), places=4)
+                self.assertAlmostEqual(delta[i], _PRICING._calculate_delta(trade), places=4)
+                self.assertAlmostEqual(vega[i], _PRICING._calculate_vega(trade), places=4)
+    
+    def test_batched_matches_scalar(self):
+        """Test the parallel batch pricer against the scalar path on random trades."""
+        import numpy as np
+        
+        rng = random.Random(42)
+        trades = [
+            replace(
+                self._atm,
+                trade_id=f"RND{i:04d}",
+                option_type=rng.choice([OptionType.CALL, OptionType.PUT]),
+                strike=rng.uniform(0.8, 1.4),
+                spot=rng.uniform(0.8, 1.4),
+                time_to_expiry=rng.uniform(0.05, 5.0),
+                volatility=rng.uniform(0.02, 0.6),
+                domestic_rate=rng.uniform(-0.01, 0.08),
+                foreign_rate=rng.uniform(-0.01, 0.08)
+            )
+            for i in range(1000)
+        ]
+        
+        def column(name):
+            return np.array([getattr(t, name) for t in trades])
+        
+        pv, delta, vega = price_portfolio_parallel(
+            column('spot'), column('strike'), column('time_to_expiry'),
+            column('volatility'), column('domestic_rate'), column('foreign_rate'),
+            np.array([t.option_type is OptionType.CALL for t in trades]),
+            column('notional')
+        )
+        
+        expected = np.array([_PRICING._price_trade(t) for t in trades]).T
+        np.testing.assert_allclose(pv, expected[0], rtol=1e-9, atol=1e-4)
+        np.testing.assert_allclose(delta, expected[1], rtol=1e-9, atol=1e-4)
+        np.testing.assert_allclose(vega, expected[2], rtol=1e-9, atol=1e-4)
+    
+    def test_approximate_cdf_matches_exact(self):
+        """Test that the approximate normal CDF stays close to the exact one."""
+        approx_engine = PricingEngineService(approximate_cdf=True)
+        
+        for option_type in [OptionType.CALL, OptionType.PUT]:
+            trade = replace(self._atm, trade_id="TEST008", option_type=option_type)
+            with self.subTest(option_type=option_type):
+                # CDF error < 7.5e-8, scaled by spot/strike x notional: well
+                # under 1 at a spot of 1.10 on 1M notional
+                self.assertTrue(math.isclose(
+                    approx_engine._calculate_pv(trade),
+                    _PRICING._calculate_pv(trade),
+                    abs_tol=1.0
+                ))
+                self.assertTrue(math.isclose(
+                    approx_engine._calculate_delta(trade),
+                    _PRICING._calculate_delta(trade),
+                    abs_tol=1.0
+                ))
 
 
 class TestValidation(unittest.TestCase):
     """Test trade validation logic."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.validator = ValidationService()
-    
     def test_valid_trade(self):
         """Test validation of a valid trade."""
         raw_trade = RawTrade(
@@ -263,7 +284,7 @@ class TestValidation(unittest.TestCase):
             OptionType="Call"
         )
         
-        result = self.validator.validate_trades([raw_trade])
+        result = _VALIDATOR.validate_trades([raw_trade])
         
         self.assertTrue(result.is_valid)
         self.assertEqual(len(result.valid_trades), 1)
@@ -285,7 +306,7 @@ class TestValidation(unittest.TestCase):
             OptionType="INVALID"
         )
         
-        result = self.validator.validate_trades([raw_trade])
+        result = _VALIDATOR.validate_trades([raw_trade])
         
         self.assertFalse(result.is_valid)
         self.assertEqual(len(result.valid_trades), 0)
@@ -308,7 +329,7 @@ class TestValidation(unittest.TestCase):
             OptionType="Call"
         )
         
-        result = self.validator.validate_trades([raw_trade])
+        result = _VALIDATOR.validate_trades([raw_trade])
         
         self.assertFalse(result.is_valid)
         self.assertIn("Invalid Underlying", result.errors[0])
@@ -329,7 +350,7 @@ class TestValidation(unittest.TestCase):
             OptionType="Call"
         )
         
-        result = self.validator.validate_trades([raw_trade])
+        result = _VALIDATOR.validate_trades([raw_trade])
         
         self.assertFalse(result.is_valid)
         self.assertIn("must be positive", result.errors[0])
@@ -350,14 +371,15 @@ class TestValidation(unittest.TestCase):
             OptionType="Call"
         )
         
-        result = self.validator.validate_trades([raw_trade])
+        result = _VALIDATOR.validate_trades([raw_trade])
         
         self.assertFalse(result.is_valid)
     
     def test_case_insensitive_option_type(self):
         """Test that option type is case-insensitive."""
-        for option_type_input in ["call", "Call", "CALL", "put", "Put", "PUT"]:
-            raw_trade = RawTrade(
+        option_type_inputs = ["call", "Call", "CALL", "put", "Put", "PUT"]
+        raw_trades = [
+            RawTrade(
                 TradeID=f"T_{option_type_input}",
                 Underlying="EUR/USD",
                 Notional=1000000.000,
@@ -370,9 +392,17 @@ class TestValidation(unittest.TestCase):
                 Expiry=0.25,
                 OptionType=option_type_input
             )
-            
-            result = self.validator.validate_trades([raw_trade])
-            self.assertTrue(result.is_valid, f"Failed for option type: {option_type_input}")
+            for option_type_input in option_type_inputs
+        ]
+        
+        result = _VALIDATOR.validate_trades(raw_trades)
+        
+        self.assertTrue(result.is_valid, result.errors)
+        self.assertEqual(len(result.valid_trades), 6)
+        for option_type_input, trade in zip(option_type_inputs, result.valid_trades):
+            with self.subTest(option_type=option_type_input):
+                self.assertEqual(trade.trade_id, f"T_{option_type_input}")
+                self.assertEqual(trade.option_type, OptionType(option_type_input.upper()))
     
     def test_currency_pair_normalization(self):
         """Test that currency pairs with slashes are normalized."""
@@ -390,7 +420,7 @@ class TestValidation(unittest.TestCase):
             OptionType="Call"
         )
         
-        result = self.validator.validate_trades([raw_trade])
+        result = _VALIDATOR.validate_trades([raw_trade])
         
         self.assertTrue(result.is_valid)
         self.assertEqual(result.valid_trades[0].currency_pair, CurrencyPair.EURUSD)
@@ -426,7 +456,7 @@ class TestValidation(unittest.TestCase):
             )
         ]
         
-        result = self.validator.validate_trades(raw_trades)
+        result = _VALIDATOR.validate_trades(raw_trades)
         
         self.assertFalse(result.is_valid)
         self.assertEqual(len(result.valid_trades), 1)
@@ -437,10 +467,6 @@ class TestValidation(unittest.TestCase):
 class TestAggregation(unittest.TestCase):
     """Test portfolio aggregation logic."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.aggregator = AggregationService()
-    
     def test_portfolio_aggregation(self):
         """Test aggregation of multiple trades."""
         from models import PricedTrade
@@ -476,7 +502,7 @@ class TestAggregation(unittest.TestCase):
             )
         ]
         
-        summary = self.aggregator.aggregate_portfolio(trades)
+        summary = _AGGREGATOR.aggregate_portfolio(trades)
         
         self.assertEqual(summary.total_trades, 2)
         self.assertEqual(summary.total_pv, 20000)
@@ -487,7 +513,7 @@ class TestAggregation(unittest.TestCase):
         """Test aggregation of empty portfolio."""
         trades = []
         
-        summary = self.aggregator.aggregate_portfolio(trades)
+        summary = _AGGREGATOR.aggregate_portfolio(trades)
         
         self.assertEqual(summary.total_trades, 0)
         self.assertEqual(summary.total_pv, 0)
@@ -515,12 +541,115 @@ class TestAggregation(unittest.TestCase):
             )
         ]
         
-        summary = self.aggregator.aggregate_portfolio(trades)
+        summary = _AGGREGATOR.aggregate_portfolio(trades)
         
         self.assertEqual(summary.total_trades, 1)
         self.assertEqual(summary.total_pv, 25000)
         self.assertEqual(summary.total_delta, 500000)
         self.assertEqual(summary.total_vega, 3000)
+        
+        # The service is a thin wrapper over the module-level function
+        self.assertEqual(aggregate_portfolio(trades, summary.valuation_date), summary)
+    
+    def test_priced_portfolio_aggregation(self):
+        """Test aggregation of a portfolio priced by the batch engine."""
+        trades = [
+            ValidatedTrade(
+                trade_id=trade_id,
+                currency_pair=CurrencyPair.EURUSD,
+                option_type=option_type,
+                strike=1.1000,
+                notional=1_000_000,
+                notional_currency="USD",
+                time_to_expiry=0.5,
+                spot=1.1000,
+                volatility=0.10,
+                domestic_rate=0.05,
+                foreign_rate=0.03
+            )
+            for trade_id, option_type in [("T1", OptionType.CALL), ("T2", OptionType.PUT)]
+        ]
+        
+        summary = _AGGREGATOR.aggregate_portfolio(_PRICING.price_portfolio(trades))
+        pv, delta, vega = _PRICING.price_trades(trades)
+        
+        self.assertEqual(summary.total_trades, 2)
+        self.assertAlmostEqual(summary.total_pv, pv.sum(), places=6)
+        self.assertAlmostEqual(summary.total_delta, delta.sum(), places=6)
+        self.assertAlmostEqual(summary.total_vega, vega.sum(), places=6)
+    
+    def test_list_aggregation_outside_record_codes(self):
+        """Test that list input is not limited to the record-array code tables."""
+        from models import PricedTrade
+        
+        trades = [
+            PricedTrade(
+                trade_id="T1",
+                currency_pair="EURUSD",
+                option_type="Call",
+                strike=1.10,
+                notional=1000000,
+                notional_currency="EUR",
+                spot=1.08,
+                time_to_expiry=0.5,
+                volatility=0.12,
+                pv=25000,
+                delta=500000,
+                vega=3000
+            )
+        ]
+        
+        summary = _AGGREGATOR.aggregate_portfolio(trades, reporting_currency="EUR")
+        
+        self.assertEqual(summary.total_trades, 1)
+        self.assertEqual(summary.total_pv, 25000)
+        self.assertEqual(summary.total_delta, 500000)
+        self.assertEqual(summary.total_vega, 3000)
+    
+    def test_record_array_aggregation(self):
+        """Test that a structured record array aggregates like the trade list."""
+        from models import PricedTrade, PricedTradeBatch
+        
+        trades = [
+            PricedTrade(
+                trade_id="T1",
+                currency_pair="EURUSD",
+                option_type="CALL",
+                strike=1.10,
+                notional=1000000,
+                notional_currency="USD",
+                spot=1.08,
+                time_to_expiry=0.5,
+                volatility=0.12,
+                pv=25000,
+                delta=500000,
+                vega=3000
+            ),
+            PricedTrade(
+                trade_id="T2",
+                currency_pair="USDJPY",
+                option_type="PUT",
+                strike=150.0,
+                notional=100000000,
+                notional_currency="JPY",
+                spot=160.0,
+                time_to_expiry=0.25,
+                volatility=0.10,
+                pv=1600000,
+                delta=-32000000,
+                vega=160000
+            )
+        ]
+        records = PricedTradeBatch.from_trades(trades).to_records()
+        
+        summary = _AGGREGATOR.aggregate_portfolio(records)
+        expected = _AGGREGATOR.aggregate_portfolio(trades)
+        
+        self.assertEqual(summary.total_trades, 2)
+        self.assertAlmostEqual(summary.total_pv, 35000)
+        self.assertAlmostEqual(summary.total_pv, expected.total_pv)
+        self.assertAlmostEqual(summary.total_delta, expected.total_delta)
+        self.assertAlmostEqual(summary.total_vega, expected.total_vega)
 
 
 if __name__ == '__main__':